@@ -0,0 +1,55 @@
+import { PrismaClient } from '@prisma/client';
+import { hashPassword, getSaltRounds } from '../src/utils/password';
+
+const prisma = new PrismaClient();
+
+/**
+ * Re-hash the API test suite's known accounts at the configured BCRYPT_ROUNDS
+ * so test logins skip the full bcrypt cost. Test-only: refuses to run unless
+ * AUTH_TEST_MODE=1, since it can lower the cost of real password hashes.
+ */
+async function main() {
+  if (process.env.AUTH_TEST_MODE !== '1') {
+    throw new Error('seed-test-users only runs with AUTH_TEST_MODE=1');
+  }
+  if (!process.env.BCRYPT_ROUNDS) {
+    // Without it hashPassword falls back to the default cost and the seed is a no-op
+    throw new Error('seed-test-users requires BCRYPT_ROUNDS (e.g. BCRYPT_ROUNDS=4)');
+  }
+
+  const adminUsername = process.env.TEST_ADMIN_USERNAME;
+  const adminPassword = process.env.TEST_ADMIN_PASSWORD;
+  const userIdentifier = process.env.TEST_USER_IDENTIFIER;
+  const userPassword = process.env.TEST_USER_PASSWORD;
+
+  if (adminUsername && adminPassword) {
+    const { count } = await prisma.adminUser.updateMany({
+      where: { username: adminUsername },
+      data: { password: await hashPassword(adminPassword) },
+    });
+    console.log(`🔑 Re-hashed ${count} test admin(s) at cost ${getSaltRounds()}`);
+  }
+
+  if (userIdentifier && userPassword) {
+    const { count } = await prisma.user.updateMany({
+      where: userIdentifier.includes('@')
+        ? { email: userIdentifier }
+        : { phone: userIdentifier },
+      data: { password: await hashPassword(userPassword) },
+    });
+    console.log(`🔑 Re-hashed ${count} test user(s) at cost ${getSaltRounds()}`);
+  }
+}
+
+main()
+  .then(() => {
+    console.log('✅ Test users seeded successfully');
+    process.exit(0);
+  })
+  .catch((error) => {
+    console.error('❌ Test user seed failed:', error);
+    process.exit(1);
+  })
+  .finally(() => {
+    prisma.$disconnect();
+  });
@@ -1,10 +1,10 @@
 import { PrismaClient } from '@prisma/client';
-import bcrypt from 'bcryptjs';
+import { hashPassword } from '../src/utils/password';
 
 const prisma = new PrismaClient();
 
 async function main() {
-  const password = await bcrypt.hash('Admin@123', 10);
+  const password = await hashPassword('Admin@123');
 
   await prisma.adminUser.upsert({
     where: { username: 'vegrushadmin' },
@@ -9,6 +9,7 @@ import {
   createProduct,
   updateProduct,
   updateProductStock,
+  deleteProduct,
 } from '../controllers/productController';
 
 const router = Router();
@@ -194,5 +195,25 @@ router.put(
   asyncHandler(updateProduct)
 );
 
-export default router;
+/**
+ * DELETE /api/admin/products/:id
+ * Protected route (admin only) - Delete product
+ * Query param: hardDelete=true for hard delete, default is soft delete
+ */
+router.delete(
+  '/:id',
+  authenticateUser,
+  requireRole(['admin']),
+  validateRequest({
+    params: [param('id').notEmpty().withMessage('Product ID is required')],
+    query: [
+      query('hardDelete')
+        .optional()
+        .isIn(['true', 'false'])
+        .withMessage('hardDelete must be true or false'),
+    ],
+  }),
+  asyncHandler(deleteProduct)
+);
 
+export default router;
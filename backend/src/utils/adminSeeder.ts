@@ -1,5 +1,5 @@
 import { PrismaClient } from '@prisma/client';
-import bcrypt from 'bcryptjs';
+import { hashPassword } from './password';
 import pino from 'pino';
 
 const prisma = new PrismaClient();
@@ -26,7 +26,7 @@ export async function ensureDefaultAdmin(): Promise<void> {
     }
 
     // Hash password
-    const hashedPassword = await bcrypt.hash(adminPassword, 10);
+    const hashedPassword = await hashPassword(adminPassword);
 
     // Create admin user
     await prisma.adminUser.create({
@@ -1,6 +1,22 @@
 import bcrypt from 'bcryptjs';
 
-const SALT_ROUNDS = 10;
+const DEFAULT_SALT_ROUNDS = 10;
+
+/**
+ * Get the bcrypt cost factor for new hashes
+ * 
+ * Reads BCRYPT_ROUNDS at call time so test environments can lower the cost
+ * (e.g. BCRYPT_ROUNDS=4). Falls back to 10 if unset or outside bcrypt's 4-31 range.
+ * 
+ * @returns Number of salt rounds
+ */
+export function getSaltRounds(): number {
+  const rounds = parseInt(process.env.BCRYPT_ROUNDS || '', 10);
+  if (Number.isInteger(rounds) && rounds >= 4 && rounds <= 31) {
+    return rounds;
+  }
+  return DEFAULT_SALT_ROUNDS;
+}
 
 /**
  * Hash a plain text password using bcrypt
@@ -24,7 +40,7 @@ export async function hashPassword(plainPassword: string): Promise<string> {
   }
 
   try {
-    const salt = await bcrypt.genSalt(SALT_ROUNDS);
+    const salt = await bcrypt.genSalt(getSaltRounds());
     const hash = await bcrypt.hash(plainPassword, salt);
     return hash;
   } catch (error) {
@@ -73,4 +89,3 @@ export async function comparePassword(
     throw new Error('Failed to compare password: Unknown error');
   }
 }
-
@@ -1,20 +1,23 @@
-import requests
 import uuid
 
+import msgspec
+import pytest
+import requests
+
+from schemas import SignupResponse
+
 BASE_URL = "http://localhost:4000"
+SIGNUP_URL = f"{BASE_URL}/api/auth/signup"
 TIMEOUT = 30
 
-def test_customer_signup_with_valid_data():
-    signup_url = f"{BASE_URL}/api/auth/signup"
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-
-    unique_suffix = str(uuid.uuid4()).replace("-", "")[:8]
+def test_customer_signup_with_valid_data(api):
+    # One uuid draw feeds both the email suffix and the phone digits
+    unique_bytes = uuid.uuid4().bytes
+    unique_suffix = unique_bytes[:4].hex()
     name = "Test User"
     email = f"testuser_{unique_suffix}@example.com"
-    phone = f"99999{str(uuid.uuid4().int)[:5]}"
+    # Backend requires 10+ digits, so the phone suffix must stay numeric
+    phone = f"99999{int.from_bytes(unique_bytes[4:7], 'big') % 100000:05d}"
     password = "strongPass123"
     
     payload = {
@@ -25,23 +28,22 @@ def test_customer_signup_with_valid_data():
     }
 
     try:
-        response = requests.post(signup_url, json=payload, headers=headers, timeout=TIMEOUT)
+        response = api.post(SIGNUP_URL, json=payload, timeout=TIMEOUT)
     except requests.RequestException as e:
         assert False, f"Request to signup endpoint failed: {e}"
 
     assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
 
-    resp_json = response.json()
-    assert isinstance(resp_json, dict), "Response is not a JSON object"
+    signup = msgspec.json.decode(response.content, type=SignupResponse)
+    assert signup.success is True, "Signup success flag is false"
 
-    assert "success" in resp_json and resp_json["success"] is True, "Signup success flag missing or false"
+    user = signup.user
+    assert user.email == email, "User email mismatch"
+    assert user.phone == phone, "User phone mismatch"
+    assert user.name == name, "User name mismatch"
 
-    assert "user" in resp_json and isinstance(resp_json["user"], dict), "User object missing or not a dict"
-    user = resp_json["user"]
-    assert "email" in user and user["email"] == email, "User email mismatch"
-    assert "phone" in user and user["phone"] == phone, "User phone mismatch"
-    assert "name" in user and user["name"] == name, "User name mismatch"
+    assert len(signup.token) > 0, "Token missing or invalid"
 
-    assert "token" in resp_json and isinstance(resp_json["token"], str) and len(resp_json["token"]) > 0, "Token missing or invalid"
 
-test_customer_signup_with_valid_data()
\ No newline at end of file
+if __name__ == "__main__":
+    pytest.main([__file__])
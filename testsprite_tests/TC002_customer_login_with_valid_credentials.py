@@ -1,29 +1,28 @@
+import orjson
+import pytest
 import requests
 
-def test_customer_login_with_valid_credentials():
-    base_url = "http://localhost:4000"
-    login_url = f"{base_url}/api/auth/login"
+BASE_URL = "http://localhost:4000"
+LOGIN_URL = f"{BASE_URL}/api/auth/login"
+
+def test_customer_login_with_valid_credentials(api):
     identifier = "sam93901704@gmail.com"
     password = "Sameer@123"
     
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "identifier": identifier,
         "password": password
     }
     
     try:
-        response = requests.post(login_url, json=payload, headers=headers, timeout=30)
+        response = api.post(LOGIN_URL, json=payload, timeout=30)
     except requests.exceptions.RequestException as e:
         assert False, f"Request failed: {e}"
     
     assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
     
     try:
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
     except ValueError:
         assert False, "Response content is not valid JSON"
         
@@ -32,4 +31,6 @@ def test_customer_login_with_valid_credentials():
     assert "token" in response_data and isinstance(response_data["token"], str) and response_data["token"], "Token missing or invalid in the response"
     assert "user" in response_data and isinstance(response_data["user"], dict), "User object missing or invalid in the response"
 
-test_customer_login_with_valid_credentials()
\ No newline at end of file
+
+if __name__ == "__main__":
+    pytest.main([__file__])
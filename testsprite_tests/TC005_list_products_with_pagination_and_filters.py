@@ -1,39 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import pytest
 import requests
 
 BASE_URL = "http://localhost:4000"
+PRODUCTS_URL = f"{BASE_URL}/api/products"
 TIMEOUT = 30
 
-def test_list_products_with_pagination_and_filters():
-    url = f"{BASE_URL}/api/products"
+# Test parameters for pagination and filters
+PRODUCT_QUERIES = [
+    {"page": 1, "limit": 5},  # basic pagination
+    {"category": "vegetables"},  # category filter
+    {"search": "tomato"},  # search keyword filter
+    {"in_stock": "true"},  # in_stock filter true
+    {"in_stock": "false"},  # in_stock filter false
+    {"page": 2, "limit": 3, "category": "fruits", "search": "apple", "in_stock": "1"}  # combined filters
+]
 
-    # Test parameters for pagination and filters
-    params_list = [
-        {"page": 1, "limit": 5},  # basic pagination
-        {"category": "vegetables"},  # category filter
-        {"search": "tomato"},  # search keyword filter
-        {"in_stock": "true"},  # in_stock filter true
-        {"in_stock": "false"},  # in_stock filter false
-        {"page": 2, "limit": 3, "category": "fruits", "search": "apple", "in_stock": "1"}  # combined filters
-    ]
 
-    for params in params_list:
+@pytest.fixture(scope="module")
+def listing_responses(api):
+    # The queries are independent, so issue them concurrently over the shared session's pool;
+    # request errors are kept per query so one failure doesn't hide the others
+    def fetch(params):
         try:
-            response = requests.get(url, params=params, timeout=TIMEOUT)
-            # The /api/products endpoint is a public route and does not require auth
-            assert response.status_code == 200, f"Failed for params {params} with status {response.status_code}"
-            data = response.json()
-            # Expecting a list or dictionary with products array/key
-            # At minimum, ensure response is JSON and contains some form of product data
-            assert isinstance(data, dict) or isinstance(data, list), "Response JSON is not a dict or list"
-            # If dict, it should have products or similar key - heuristic checks
-            if isinstance(data, dict):
-                if "products" in data:
-                    assert isinstance(data["products"], list), "'products' key is not a list"
-                elif "data" in data:
-                    # sometimes response might wrap products inside data
-                    assert isinstance(data["data"], list), "'data' key is not a list"
-            # If list, it is directly the products list
-        except requests.exceptions.RequestException as e:
-            assert False, f"HTTP request failed: {e}"
-
-test_list_products_with_pagination_and_filters()
+            return api.get(PRODUCTS_URL, params=params, timeout=TIMEOUT)
+        except requests.RequestException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(PRODUCT_QUERIES)) as executor:
+        return list(executor.map(fetch, PRODUCT_QUERIES))
+
+
+@pytest.mark.parametrize(("index", "params"), list(enumerate(PRODUCT_QUERIES)))
+def test_list_products_with_pagination_and_filters(listing_responses, index, params):
+    response = listing_responses[index]
+    if isinstance(response, Exception):
+        raise response
+    # The /api/products endpoint is a public route and does not require auth
+    assert response.status_code == 200, f"Failed for params {params} with status {response.status_code}"
+    data = orjson.loads(response.content)
+    # Expecting a list or dictionary with products array/key
+    # At minimum, ensure response is JSON and contains some form of product data
+    assert isinstance(data, dict) or isinstance(data, list), "Response JSON is not a dict or list"
+    # If dict, it should have products or similar key - heuristic checks
+    if isinstance(data, dict):
+        if "products" in data:
+            assert isinstance(data["products"], list), "'products' key is not a list"
+        elif "data" in data:
+            # sometimes response might wrap products inside data
+            assert isinstance(data["data"], list), "'data' key is not a list"
+    # If list, it is directly the products list
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,219 @@
+import os
+import subprocess
+import uuid
+import warnings
+from collections import namedtuple
+from pathlib import Path
+
+import jmespath
+import orjson
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "http://localhost:4000"
+ADMIN_LOGIN_URL = f"{BASE_URL}/api/auth/admin/login"
+USER_LOGIN_URL = f"{BASE_URL}/api/auth/login"
+PRODUCTS_URL = f"{BASE_URL}/api/products"
+CREATE_PRODUCT_URL = f"{BASE_URL}/api/admin/products"
+ADMIN_PRODUCT_URL_TEMPLATE = f"{BASE_URL}/api/admin/products/{{product_id}}"
+TIMEOUT = 30
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+
+ADMIN_USERNAME = "sam93901704@gmail.com"
+ADMIN_PASSWORD = "Sameer@123"
+USER_IDENTIFIER = "sam93901704@gmail.com"
+USER_PASSWORD = "Sameer@123"
+
+# Products created by this suite; hard-deleted after each test
+TEST_PRODUCT_PREFIX = "Test Product "
+
+# The API returns products bare, as a list, or wrapped under 'products'/'data'/'product'
+# The listing includes inactive products and other workers' throwaway products, so skip both
+ACTIVE_PRODUCT_ID = jmespath.compile(
+    f"(products || data || @)[?isActive && !starts_with(name, '{TEST_PRODUCT_PREFIX}')].id | [0]"
+)
+CREATED_PRODUCT = jmespath.compile("product || @")
+
+DEFAULT_PRODUCT = {
+    "name": "Fresh Organic Tomatoes",
+    "description": "Ripe, juicy and fresh organic tomatoes from local farms.",
+    "category": "Vegetables",
+    "price": 120,
+    "unitType": "kg",
+    "unitValue": 1.0,
+    "stockQty": 50,
+    "imageUrl": "https://example.com/images/tomatoes.jpg",
+    "isActive": True
+}
+
+
+@pytest.fixture(scope="session")
+def api():
+    # One keep-alive connection pool to the backend shared by every test
+    session = requests.Session()
+    # Skip the per-request proxy/netrc environment lookups; the target is loopback
+    session.trust_env = False
+    # Payloads are small JSON over loopback; skip compression and keep the connection open
+    session.headers.update({
+        "Accept-Encoding": "identity",
+        "Connection": "keep-alive",
+        "Content-Type": "application/json"
+    })
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    yield session
+    session.close()
+
+
+# Status and body of a login; the controller's logins are shipped to xdist workers as these fields
+LoginResponse = namedtuple("LoginResponse", ["status_code", "content"])
+LOGINS_KEY = pytest.StashKey[dict]()
+
+LOGINS = {
+    "admin": (ADMIN_LOGIN_URL, {"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD}),
+    "user": (USER_LOGIN_URL, {"identifier": USER_IDENTIFIER, "password": USER_PASSWORD})
+}
+
+
+def _seed_test_users():
+    # Test mode only: re-hash the known accounts at the server's BCRYPT_ROUNDS (e.g. 4)
+    if os.environ.get("AUTH_TEST_MODE") != "1":
+        return
+    bcrypt_rounds = os.environ.get("BCRYPT_ROUNDS")
+    if not bcrypt_rounds:
+        raise pytest.UsageError("AUTH_TEST_MODE=1 requires BCRYPT_ROUNDS to match the server's (e.g. BCRYPT_ROUNDS=4)")
+    subprocess.run(
+        ["npx", "ts-node", "prisma/seed-test-users.ts"],
+        cwd=BACKEND_DIR,
+        env={
+            **os.environ,
+            "BCRYPT_ROUNDS": bcrypt_rounds,
+            "TEST_ADMIN_USERNAME": ADMIN_USERNAME,
+            "TEST_ADMIN_PASSWORD": ADMIN_PASSWORD,
+            "TEST_USER_IDENTIFIER": USER_IDENTIFIER,
+            "TEST_USER_PASSWORD": USER_PASSWORD
+        },
+        check=True
+    )
+
+
+def _login(session, name):
+    url, payload = LOGINS[name]
+    resp = session.post(url, json=payload, timeout=TIMEOUT)
+    return LoginResponse(resp.status_code, resp.content)
+
+
+def pytest_sessionstart(session):
+    # Runs once on the controller, before xdist starts any workers
+    config = session.config
+    if hasattr(config, "workerinput") or config.option.collectonly:
+        return
+    _seed_test_users()
+    # Log in once per run; workers reuse these instead of each paying for bcrypt
+    logins = {}
+    with requests.Session() as http:
+        http.trust_env = False
+        for name in LOGINS:
+            try:
+                logins[name] = tuple(_login(http, name))
+            except requests.RequestException:
+                # Server unreachable; leave it to the fixtures to log in and report the error
+                pass
+    config.stash[LOGINS_KEY] = logins
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # xdist: hand the controller's logins to each worker
+    node.workerinput["logins"] = node.config.stash.get(LOGINS_KEY, {})
+
+
+def _shared_login(config, api, name):
+    if hasattr(config, "workerinput"):
+        logins = config.workerinput.get("logins", {})
+    else:
+        logins = config.stash.get(LOGINS_KEY, {})
+    if name in logins:
+        return LoginResponse(*logins[name])
+    return _login(api, name)
+
+
+def _bearer_headers(resp):
+    assert resp.status_code == 200, f"Login failed with status code {resp.status_code}"
+    data = orjson.loads(resp.content)
+    assert data.get("success") is True, "Login success flag is not True"
+    token = data.get("token")
+    assert isinstance(token, str) and token, "Token not found in login response"
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="session")
+def admin_login(request, api):
+    # The run's single admin login, made on the controller and shared with every worker
+    return _shared_login(request.config, api, "admin")
+
+
+@pytest.fixture(scope="session")
+def admin_headers(admin_login):
+    return _bearer_headers(admin_login)
+
+
+@pytest.fixture(scope="session")
+def user_headers(request, api):
+    return _bearer_headers(_shared_login(request.config, api, "user"))
+
+
+@pytest.fixture(scope="session")
+def any_product_id(api):
+    # An orderable (active, in-stock) product id, for tests that only need some existing product
+    resp = api.get(
+        PRODUCTS_URL,
+        params={"in_stock": "true", "limit": 100},
+        timeout=TIMEOUT
+    )
+    resp.raise_for_status()
+    product_id = ACTIVE_PRODUCT_ID.search(orjson.loads(resp.content))
+    assert product_id, "No active, in-stock product found in product list"
+    return product_id
+
+
+@pytest.fixture
+def product_payload():
+    # Unique name so parallel workers never collide on the same product
+    return DEFAULT_PRODUCT | {"name": f"{TEST_PRODUCT_PREFIX}{uuid.uuid4()}"}
+
+
+@pytest.fixture
+def product_cleanup(api, admin_headers):
+    # Tests append ids of products they create; they are hard-deleted afterwards
+    product_ids = []
+    yield product_ids
+    for product_id in product_ids:
+        try:
+            del_resp = api.delete(
+                ADMIN_PRODUCT_URL_TEMPLATE.format(product_id=product_id),
+                params={"hardDelete": "true"},
+                headers=admin_headers,
+                timeout=TIMEOUT
+            )
+            if del_resp.status_code not in (200, 204):
+                warnings.warn(f"Failed to delete product with id {product_id} during cleanup, status code: {del_resp.status_code}")
+        except requests.RequestException as e:
+            warnings.warn(f"Exception deleting product with id {product_id} during cleanup: {e}")
+
+
+@pytest.fixture
+def product(api, admin_headers, product_payload, product_cleanup):
+    # Create a throwaway product for the test; product_cleanup deletes it afterwards
+    resp = api.post(
+        CREATE_PRODUCT_URL,
+        json=product_payload,
+        headers=admin_headers,
+        timeout=TIMEOUT
+    )
+    resp.raise_for_status()
+    created = CREATED_PRODUCT.search(orjson.loads(resp.content))
+    product_id = created.get("id")
+    assert product_id, "Created product does not have an id"
+    product_cleanup.append(product_id)
+    return created
@@ -0,0 +1,46 @@
+from typing import Optional, Union
+
+import msgspec
+
+
+# Response shapes returned by the backend; decoding fails on missing fields or wrong types
+class User(msgspec.Struct):
+    id: str
+    name: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+
+
+class CurrentUser(msgspec.Struct):
+    id: str
+    name: Optional[str]
+    email: str
+    phone: Optional[str]
+    profilePic: Optional[str]
+    phoneVerified: bool
+
+
+class SignupResponse(msgspec.Struct):
+    success: bool
+    user: User
+    token: str
+
+
+class AdminLoginResponse(msgspec.Struct):
+    success: bool
+    admin: dict
+    token: str
+
+
+class CurrentUserResponse(msgspec.Struct):
+    user: CurrentUser
+
+
+class Product(msgspec.Struct):
+    id: str
+    name: str
+    category: str
+    price: float
+    unitType: str
+    # Prisma serializes Decimal columns as strings
+    unitValue: Union[str, float]